@@ -0,0 +1,29 @@
+"""
+Gunicorn configuration for production deployment.
+
+Run with: gunicorn -c gunicorn.conf.py main:app
+
+One worker per CPU core lets the synchronous simulation endpoints scale
+across cores while each UvicornWorker keeps the async event loop for I/O.
+preload_app imports main.py (and builds the precomputed tax table / warms
+the numba kernels) once in the master process, so forked workers share
+those read-only pages copy-on-write instead of each paying the import cost.
+"""
+
+import multiprocessing
+
+bind = "0.0.0.0:8000"
+workers = multiprocessing.cpu_count()
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+
+# Heartbeat tmpfiles on tmpfs to avoid disk stalls blocking the arbiter
+worker_tmp_dir = "/dev/shm"
+
+# Recycle workers periodically to bound any slow leak from the data fetchers
+max_requests = 10000
+max_requests_jitter = 1000
+
+accesslog = None
+errorlog = "-"
+loglevel = "info"
@@ -0,0 +1,5 @@
+#!/bin/sh
+# Production launcher: gunicorn arbiter with one UvicornWorker per core
+# (see gunicorn.conf.py). `python main.py` remains the single-process dev path.
+cd "$(dirname "$0")"
+exec gunicorn -c gunicorn.conf.py main:app